@@ -7,6 +7,10 @@ echo "--- Cleaning up old build artifacts ---"
 rm -rf dist/
 rm -rf build/
 
+echo
+echo "--- Pre-building the parser tables bundled with the grammar ---"
+python -c "from cx_shell.interactive.executor import write_bundled_parser_tables; print(write_bundled_parser_tables())"
+
 echo
 echo "--- Building the single-file executable using cx.spec ---"
 pyinstaller cx.spec
@@ -1,11 +1,14 @@
 import asyncio
+import atexit
 import functools
 import importlib.metadata
 import json
 import logging
+import logging.handlers
 import os
 from pathlib import Path
 import shlex
+import queue
 import shutil
 import sys
 from typing import Optional
@@ -17,7 +20,7 @@ import yaml
 from rich.console import Console
 from rich.traceback import Traceback
 
-from cx_shell.interactive.executor import CommandExecutor
+from cx_shell.interactive.executor import CommandExecutor, refresh_log_level
 from cx_shell.interactive.main import start_repl
 from cx_shell.interactive.session import SessionState
 from cx_shell.management.upgrade_manager import UpgradeManager
@@ -39,7 +42,22 @@ def version_callback(value: bool):
         raise typer.Exit()
 
 
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_log_listener():
+    """Flushes queued records and stops the listener thread, if one is running."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
+
 def setup_logging(verbose: bool):
+    global _log_listener
     log_level = logging.DEBUG if verbose else logging.INFO
     shared_processors = [
         structlog.contextvars.merge_contextvars,
@@ -59,12 +77,21 @@ def setup_logging(verbose: bool):
         foreign_pre_chain=shared_processors,
         processor=structlog.dev.ConsoleRenderer(),
     )
-    handler = logging.StreamHandler(sys.stderr)
-    handler.setFormatter(formatter)
+    # Records are rendered by the queue handler on the calling thread, since
+    # callers may mutate the values they logged right afterwards; only the
+    # stderr write happens on the listener's thread.
+    queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+    queue_handler.setFormatter(formatter)
+    _stop_log_listener()
+    _log_listener = logging.handlers.QueueListener(
+        queue_handler.queue, logging.StreamHandler(sys.stderr)
+    )
+    _log_listener.start()
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
-    root_logger.addHandler(handler)
+    root_logger.addHandler(queue_handler)
     root_logger.setLevel(log_level)
+    refresh_log_level()
     if verbose:
         logging.getLogger("httpx").setLevel(logging.DEBUG)
 
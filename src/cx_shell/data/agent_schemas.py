@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Dict, Any, Literal, Optional
 
 # --- Agent Configuration Schemas (for agents.config.yaml) ---
@@ -104,6 +104,9 @@ class AnalystResponse(BaseModel):
 class DryRunResult(BaseModel):
     """Represents the predicted outcome of a command's execution."""
 
+    # Frozen so a single instance can be shared safely between dry runs.
+    model_config = ConfigDict(frozen=True)
+
     indicates_failure: bool = Field(
         False, description="True if the simulation predicts a runtime error."
     )
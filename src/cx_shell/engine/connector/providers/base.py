@@ -11,6 +11,12 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+# DryRunResult is frozen, so every strategy without a simulation shares one.
+_DRY_RUN_NOT_IMPLEMENTED = DryRunResult(
+    indicates_failure=False,
+    message="Dry run not implemented for this action type. Assuming success.",
+)
+
 
 class BaseConnectorStrategy(ABC):
     """The abstract "contract" for all connection strategies."""
@@ -78,7 +84,4 @@ class BaseConnectorStrategy(ABC):
             A DryRunResult object summarizing the predicted outcome.
         """
         # Default implementation for strategies that don't support dry run yet.
-        return DryRunResult(
-            indicates_failure=False,
-            message="Dry run not implemented for this action type. Assuming success.",
-        )
+        return _DRY_RUN_NOT_IMPLEMENTED
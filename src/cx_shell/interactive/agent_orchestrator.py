@@ -21,7 +21,7 @@ from ..agent.planner_agent import PlannerAgent
 from ..agent.tool_specialist_agent import ToolSpecialistAgent
 from ..agent.analyst_agent import AnalystAgent
 from ..data.agent_schemas import AgentBeliefs, CommandOption, PlanStep, AnalystResponse
-from .commands import BuiltinCommand
+from .commands import ConnectCommand
 
 logger = structlog.get_logger(__name__)
 
@@ -104,9 +104,7 @@ class AgentOrchestrator:
                 default=compatible_conns[0],
             )
             if chosen_conn_id in compatible_conns:
-                await self.executor.execute_connect(
-                    [f"user:{chosen_conn_id}", "--as", alias]
-                )
+                await self.executor.execute_connect([(f"user:{chosen_conn_id}", alias)])
                 return alias in self.state.connections
 
         feature_name = (
@@ -124,9 +122,7 @@ class AgentOrchestrator:
         )
 
         if created_conn_id:
-            await self.executor.execute_connect(
-                [f"user:{created_conn_id}", "--as", alias]
-            )
+            await self.executor.execute_connect([(f"user:{created_conn_id}", alias)])
         else:
             CONSOLE.print("[yellow]Setup cancelled. Agent cannot proceed.[/yellow]")
             return False
@@ -295,7 +291,8 @@ class AgentOrchestrator:
                     f"Executing `[bold cyan]{final_command_to_run_str}[/bold cyan]`..."
                 ):
                     parsed_tree = self.executor.parser.parse(final_command_to_run_str)
-                    executable_obj, _ = self.executor.transformer.transform(parsed_tree)
+                    pipeline = self.executor.transformer.transform(parsed_tree)
+                    executable_obj, _ = pipeline.commands[0]
                     observation = await self.executor._execute_executable(
                         executable_obj
                     )
@@ -537,14 +534,15 @@ class AgentOrchestrator:
         valid_options = []
         for option in options:
             try:
-                executable_obj, _ = self.executor.transformer.transform(
+                pipeline = self.executor.transformer.transform(
                     self.executor.parser.parse(option.cx_command)
                 )
-                if (
-                    isinstance(executable_obj, BuiltinCommand)
-                    and executable_obj.command == "connect"
-                ):
-                    if executable_obj.args[2] in self.state.connections:
+                executable_obj, _ = pipeline.commands[0]
+                if isinstance(executable_obj, ConnectCommand):
+                    if all(
+                        alias in self.state.connections
+                        for _, alias in executable_obj.targets
+                    ):
                         logger.warn("Pruning redundant connect command", option=option)
                         continue
                 valid_options.append(option)
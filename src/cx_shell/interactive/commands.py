@@ -1,6 +1,6 @@
 from abc import ABC
 from pathlib import Path
-from typing import Any, List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple
 
 # Rich imports are only for type hinting, not for direct use.
 from rich.status import Status
@@ -33,6 +33,8 @@ def create_script_for_step(step: ConnectorStep) -> ConnectorScript:
 class Command(ABC):
     """Abstract base class for all executable REPL commands."""
 
+    __slots__ = ()
+
     async def execute(
         self,
         state: SessionState,
@@ -49,19 +51,38 @@ class Command(ABC):
 class DotNotationCommand(Command):
     """Represents a command like `gh.getUser(username="torvalds")`."""
 
+    __slots__ = ("alias", "action_name", "kwargs", "_action_params")
+
     def __init__(self, alias: str, action_name: str, kwargs: Dict[str, Any]):
         self.alias = alias
         self.action_name = action_name
         self.kwargs = kwargs
+        self._action_params: Optional[Dict[str, Any]] = None
+
+    def connection_source(self, state: SessionState) -> str:
+        try:
+            return state.connections[self.alias]
+        except KeyError:
+            raise ValueError(f"Unknown connection alias '{self.alias}'.") from None
+
+    def action_params(self) -> Dict[str, Any]:
+        """
+        The serialized `run` block of this command's step, built once. Dry runs
+        use it directly instead of validating a ConnectorStep and dumping it again.
+        """
+        if self._action_params is None:
+            self._action_params = RunDeclarativeAction(
+                action="run_declarative_action",
+                template_key=self.action_name,
+                context=self.kwargs,
+            ).model_dump()
+        return self._action_params
 
     def to_step(self, state: SessionState) -> ConnectorStep:
-        if self.alias not in state.connections:
-            raise ValueError(f"Unknown connection alias '{self.alias}'.")
-        connection_source = state.connections[self.alias]
         return ConnectorStep(
             id=f"interactive_{self.action_name}",
             name=f"Interactive {self.action_name}",
-            connection_source=connection_source,
+            connection_source=self.connection_source(state),
             run=RunDeclarativeAction(
                 action="run_declarative_action",
                 template_key=self.action_name,
@@ -90,6 +111,8 @@ class DotNotationCommand(Command):
 class PositionalArgActionCommand(Command):
     """Represents a command with a single positional arg, like `db.query("...")`."""
 
+    __slots__ = ("alias", "action_name", "arg")
+
     def __init__(self, alias: str, action_name: str, arg: Any):
         self.alias = alias
         self.action_name = action_name
@@ -140,6 +163,8 @@ class PositionalArgActionCommand(Command):
 class BuiltinCommand(Command):
     """Represents a built-in command like `connect` or `help`."""
 
+    __slots__ = ("command", "args")
+
     def __init__(self, parts: List[str]):
         self.command = parts[0].lower() if parts else ""
         self.args = parts[1:] if len(parts) > 1 else []
@@ -156,9 +181,32 @@ class BuiltinCommand(Command):
         )
 
 
+class ConnectCommand(Command):
+    """Represents `connect <source> --as <alias>[, ...]`."""
+
+    __slots__ = ("targets",)
+
+    def __init__(self, targets: List[Tuple[str, str]]):
+        # (source, alias) pairs, in the order they were written.
+        self.targets = targets
+
+    async def execute(
+        self,
+        state: SessionState,
+        service: ConnectorService,
+        status: Status,
+        piped_input: Any = None,
+    ) -> Any:
+        raise NotImplementedError(
+            "ConnectCommand execution is handled by CommandExecutor."
+        )
+
+
 class AssignmentCommand(Command):
     """Represents a variable assignment."""
 
+    __slots__ = ("var_name", "command_to_run")
+
     def __init__(self, var_name: str, command_to_run: Command):
         self.var_name = var_name
         self.command_to_run = command_to_run
@@ -180,6 +228,8 @@ class AssignmentCommand(Command):
 class InspectCommand(Command):
     """Represents a variable inspection, e.g., `my_var?`."""
 
+    __slots__ = ("var_name",)
+
     def __init__(self, var_name: str):
         self.var_name = var_name
 
@@ -215,6 +265,8 @@ class InspectCommand(Command):
 class PipelineCommand(Command):
     """Represents a series of commands chained by pipes. Acts as a data container."""
 
+    __slots__ = ("commands",)
+
     def __init__(self, commands: List[Command]):
         self.commands = commands
 
@@ -233,6 +285,8 @@ class PipelineCommand(Command):
 class ScriptedCommand(Command):
     """Represents a command that runs a YAML script, like `transform run`."""
 
+    __slots__ = ("command_type", "script_path")
+
     def __init__(self, command_type: str, script_path: str):
         self.command_type = command_type
         self.script_path = script_path
@@ -263,6 +317,8 @@ class ScriptedCommand(Command):
 class SessionCommand(Command):
     """Represents a session management command, e.g., `session save my-session`."""
 
+    __slots__ = ("subcommand", "arg")
+
     def __init__(self, subcommand: str, arg: str | None = None):
         self.subcommand = subcommand
         self.arg = arg
@@ -284,6 +340,8 @@ class SessionCommand(Command):
 class VariableCommand(Command):
     """Represents a variable management command, e.g., `var list` or `var rm my_var`."""
 
+    __slots__ = ("subcommand", "arg")
+
     def __init__(self, subcommand: str, arg: str | None = None):
         self.subcommand = subcommand
         self.arg = arg
@@ -305,6 +363,8 @@ class VariableCommand(Command):
 class FlowCommand(Command):
     """Represents a flow management command, e.g., `flow list` or `flow run`."""
 
+    __slots__ = ("subcommand", "named_args")
+
     def __init__(self, subcommand: str, named_args: Dict[str, Any]):
         self.subcommand = subcommand
         self.named_args = named_args
@@ -324,6 +384,8 @@ class FlowCommand(Command):
 class QueryCommand(Command):
     """Represents a query management command, e.g., `query run --on db --name my-query`."""
 
+    __slots__ = ("subcommand", "named_args")
+
     def __init__(self, subcommand: str, named_args: Dict[str, Any]):
         self.subcommand = subcommand
         self.named_args = named_args
@@ -343,6 +405,8 @@ class QueryCommand(Command):
 class ScriptCommand(Command):
     """Represents a script management command, e.g., `script run --name my-script`."""
 
+    __slots__ = ("subcommand", "named_args")
+
     def __init__(self, subcommand: str, named_args: Dict[str, Any]):
         self.subcommand = subcommand
         self.named_args = named_args
@@ -362,6 +426,8 @@ class ScriptCommand(Command):
 class ConnectionCommand(Command):
     """Represents a connection management command, e.g., `connection list` or `connection create`."""
 
+    __slots__ = ("subcommand", "named_args")
+
     def __init__(self, subcommand: str, named_args: Dict[str, Any] | None = None):
         self.subcommand = subcommand
         self.named_args = named_args or {}
@@ -385,6 +451,8 @@ class ConnectionCommand(Command):
 class OpenCommand(Command):
     """Represents the `open` command for assets, now with support for named arguments."""
 
+    __slots__ = ("asset_type", "asset_name", "named_args")
+
     def __init__(
         self, asset_type: str, asset_name: str | None, named_args: Dict[str, Any]
     ):
@@ -411,6 +479,8 @@ class OpenCommand(Command):
 class AppCommand(Command):
     """Represents an application management command."""
 
+    __slots__ = ("subcommand", "args")
+
     def __init__(self, subcommand: str, args: Dict[str, Any]):
         self.subcommand = subcommand
         self.args = args
@@ -429,6 +499,8 @@ class AppCommand(Command):
 class AgentCommand(Command):
     """Represents an agent invocation command, e.g., `agent 'do something'`."""
 
+    __slots__ = ("goal",)
+
     def __init__(self, goal: str):
         self.goal = goal
 
@@ -445,6 +517,8 @@ class AgentCommand(Command):
 class ProcessCommand(Command):
     """Represents a background process management command, e.g., `process list`."""
 
+    __slots__ = ("subcommand", "arg", "follow")
+
     def __init__(self, subcommand: str, arg: str | None = None, follow: bool = False):
         self.subcommand = subcommand
         self.arg = arg
@@ -463,6 +537,8 @@ class ProcessCommand(Command):
 class CompileCommand(Command):
     """Represents a `compile` command with its named arguments."""
 
+    __slots__ = ("named_args",)
+
     def __init__(self, named_args: Dict[str, Any]):
         self.named_args = named_args
 
@@ -480,6 +556,8 @@ class CompileCommand(Command):
 class WorkspaceCommand(Command):
     """Represents a workspace management command."""
 
+    __slots__ = ("subcommand", "args")
+
     def __init__(self, subcommand: str, args: Dict[str, Any]):
         self.subcommand = subcommand
         self.args = args
@@ -499,6 +577,8 @@ class WorkspaceCommand(Command):
 class FindCommand(Command):
     """Represents a VFS find command."""
 
+    __slots__ = ("query", "args")
+
     def __init__(self, query: Optional[str], args: Dict[str, Any]):
         self.query = query
         self.args = args
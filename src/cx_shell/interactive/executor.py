@@ -1,39 +1,39 @@
 # [REPLACE] /home/dpwanjala/repositories/cx-shell/src/cx_shell/interactive/executor.py
 
 import asyncio
-import json
-from typing import Dict, List, Any, Optional
+import inspect
+import io
+import logging
+import os
+import pickle
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import cached_property, lru_cache, partial
+from operator import attrgetter
+from pathlib import Path
+from typing import Callable, ClassVar, Dict, List, Any, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
 from ast import literal_eval
 import jmespath
+import orjson
 import structlog
 
-from lark import Lark, Transformer, v_args
+from lark import Lark, LarkError, Tree, v_args
+from lark.visitors import Transformer_NonRecursive
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
 from rich import box
-
-from ..engine.connector.service import ConnectorService
-from ..management.session_manager import SessionManager
-from ..management.variable_manager import VariableManager
-from ..management.flow_manager import FlowManager
-from ..management.query_manager import QueryManager
-from ..management.script_manager import ScriptManager
-from ..management.connection_manager import ConnectionManager
-from ..management.open_manager import OpenManager
-from ..management.app_manager import AppManager
-from ..management.process_manager import ProcessManager
-from .agent_orchestrator import AgentOrchestrator
-from ..management.compile_manager import CompileManager
-from ..management.workspace_manager import WorkspaceManager
-from ..management.index_manager import IndexManager
-from ..management.find_manager import FindManager
+from rich.text import Text
 
 from .commands import (
     Command,
     DotNotationCommand,
     BuiltinCommand,
+    ConnectCommand,
     PositionalArgActionCommand,
     AssignmentCommand,
     InspectCommand,
@@ -54,46 +54,286 @@ from .commands import (
 )
 from .session import SessionState
 from ..data.agent_schemas import DryRunResult
-from ..utils import get_pkg_root
+from ..utils import CX_HOME, get_console, get_pkg_root
 from .output_handler import IOutputHandler
 
-console = Console()
+if TYPE_CHECKING:
+    from .agent_orchestrator import AgentOrchestrator
+    from ..engine.connector.service import ConnectorService
+    from ..management.app_manager import AppManager
+    from ..management.compile_manager import CompileManager
+    from ..management.connection_manager import ConnectionManager
+    from ..management.find_manager import FindManager
+    from ..management.flow_manager import FlowManager
+    from ..management.index_manager import IndexManager
+    from ..management.open_manager import OpenManager
+    from ..management.process_manager import ProcessManager
+    from ..management.query_manager import QueryManager
+    from ..management.script_manager import ScriptManager
+    from ..management.session_manager import SessionManager
+    from ..management.variable_manager import VariableManager
+    from ..management.workspace_manager import WorkspaceManager
+
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
+@lru_cache(maxsize=1)
+def _debug_enabled() -> bool:
+    """
+    Whether debug events will be emitted. The CLI's stdlib-backed logger runs
+    its whole processor chain before the level check, so hot paths use this
+    to skip debug calls outright. Loggers without a level check count as on.
+    Those call sites also test __debug__ first, so under `python -O` the
+    compiler drops them entirely. The answer is cached until
+    refresh_log_level() is called.
+    """
+    bound = logger.bind()
+    check = getattr(bound, "isEnabledFor", None) or getattr(
+        bound, "is_enabled_for", None
+    )
+    return check(logging.DEBUG) if check is not None else True
+
+
+def refresh_log_level() -> None:
+    """Re-reads the log level the next time a debug call is gated."""
+    _debug_enabled.cache_clear()
+
+
+# Lark pickles the compiled LALR tables here; the file header carries a hash of
+# the grammar and parser options, so a changed grammar is rebuilt automatically.
+PARSER_CACHE_FILE = CX_HOME / "cache" / "cx_grammar.lark.cache"
+# Tables pre-built by build.sh and bundled next to the grammar, so a fresh
+# install never compiles the grammar. The first line is _grammar_digest(),
+# which keeps a stale file from outliving a grammar or Lark upgrade.
+BUNDLED_PARSER_TABLES = "cx.lark.tables"
+
+# Must match across _build_lark() and the bundled tables.
+_LARK_OPTIONS = {
+    "start": "start",
+    "parser": "lalr",
+    # Only the terminals valid in the current parser state are tried, which
+    # suits a keyword-heavy grammar.
+    "lexer": "contextual",
+    "maybe_placeholders": False,
+    "propagate_positions": False,
+}
+
+
+def _grammar_dir() -> Path:
+    return get_pkg_root() / "interactive" / "grammar"
+
+
+def _lark_plugins() -> Dict[str, Any]:
+    # lark_cython (the optional "speedups" extra) swaps in a C lexer and LALR
+    # driver; the pure-Python parser is the fallback.
+    try:
+        import lark_cython
+
+        return lark_cython.plugins
+    except ImportError:
+        return {}
+
+
+def _grammar_digest(grammar: str) -> bytes:
+    import hashlib
+    import lark
+
+    key = grammar + repr(sorted(_LARK_OPTIONS.items())) + lark.__version__
+    return hashlib.sha256(key.encode("utf-8")).hexdigest().encode("ascii")
+
+
+def _build_lark(cache) -> Lark:
+    """Builds the LALR parser for cx.lark, preferring the bundled tables."""
+    grammar = (_grammar_dir() / "cx.lark").read_text(encoding="utf-8")
+    plugins = _lark_plugins()
+    # Lark.load() cannot attach plugins, so with lark_cython installed the
+    # per-user cache (which can) is used instead of the bundled tables.
+    if not plugins:
+        try:
+            with open(_grammar_dir() / BUNDLED_PARSER_TABLES, "rb") as f:
+                if f.readline().rstrip() == _grammar_digest(grammar):
+                    return Lark.load(f)
+        except FileNotFoundError:
+            pass
+        except (
+            OSError,
+            pickle.UnpicklingError,
+            EOFError,
+            KeyError,
+            IndexError,
+            ValueError,
+            AttributeError,
+            TypeError,
+        ) as e:
+            # A damaged file, or a Lark release that reads it differently, only
+            # costs the startup time the tables were meant to save.
+            logger.warning("executor.bundled_parser_tables.unusable", error=repr(e))
+    return Lark(grammar, cache=cache, _plugins=plugins, **_LARK_OPTIONS)
+
+
+def write_bundled_parser_tables() -> Path:
+    """Compiles the grammar into the tables bundled with release builds."""
+    grammar = (_grammar_dir() / "cx.lark").read_text(encoding="utf-8")
+    path = _grammar_dir() / BUNDLED_PARSER_TABLES
+    parser = Lark(grammar, **_LARK_OPTIONS)
+    with open(path, "wb") as f:
+        f.write(_grammar_digest(grammar) + b"\n")
+        parser.save(f)
+    return path
+
+
+# Commands that finish faster than this (seconds) never show a spinner.
+SPINNER_DELAY = 0.1
+
+# Most recently used connection sources kept resolved for dry runs.
+DRY_RUN_POOL_SIZE = 64
+# Distinct command texts whose parsed form is kept for dry runs.
+DRY_RUN_PARSE_CACHE_SIZE = 256
+# Command lines longer than this are parsed off the event loop by execute();
+# shorter ones parse faster than a thread hop.
+THREADED_PARSE_MIN_LENGTH = 256
+# Seconds a successful `connect` probe is trusted before the source is re-tested.
+CONNECTION_PROBE_TTL = 30.0
+
+# Returned by every dry run that has nothing deeper to simulate.
+_DRY_RUN_OK = DryRunResult(
+    indicates_failure=False, message="Command is syntactically valid."
+)
+
+# Stands in for the result of a connection test skipped by the probe cache.
+_CONNECTION_PROBE_HIT = {"status": "success"}
+
+# Connect result templates, parsed once; each message copies one and appends
+# the alias or error as plain text.
+_CONNECT_SUCCESS_PREFIX = Text.from_markup(
+    "[bold green]✅ Connection successful.[/bold green] Alias '"
+)
+_CONNECT_SUCCESS_SUFFIX = Text("' is now active.")
+_CONNECT_FAILURE_PREFIX = Text.from_markup(
+    "[bold red]❌ Connection failed:[/bold red] "
+)
+
+
+@dataclass(slots=True, frozen=True)
 class VariableLookup:
     var_name: str
 
 
-@v_args(inline=True)
-class CommandTransformer(Transformer):
-    """Transforms the Lark parse tree into our executable Command objects."""
+@lru_cache(maxsize=4096)
+def _cached_literal_eval(text: str) -> Any:
+    return literal_eval(text)
+
+
+def _literal_eval_cached(text: str) -> Any:
+    """
+    literal_eval for STRING/NUMBER token text, memoized because agent loops
+    and pipelines repeat the same literals. Long literals are almost always
+    one-off, so they bypass the cache rather than evicting useful entries.
+    """
+    if len(text) > 1024:
+        return literal_eval(text)
+    return _cached_literal_eval(text)
+
+
+def _string_literal(text: str) -> str:
+    """
+    Decodes STRING token text. The grammar never lets the enclosing quote
+    appear inside, so without a backslash the literal is just the text between
+    the quotes; only escaped strings need literal_eval's decoding.
+    """
+    if "\\" not in text:
+        return text[1:-1]
+    return _literal_eval_cached(text)
+
+
+def _number_literal(text: str) -> Any:
+    """
+    Decodes NUMBER (SIGNED_NUMBER) token text without parsing Python source.
+    The grammar only produces a float when there is a decimal point or an
+    exponent, so checking for those picks the conversion without a failed try.
+    """
+    if "." in text or "e" in text or "E" in text:
+        return float(text)
+    return int(text)
+
+
+# Envelope keys a bare result is unwrapped from, in priority order. A single
+# get() per key (against a sentinel, since None is a valid payload) replaces
+# the membership test plus subscript.
+_UNWRAP_KEYS = ("results", "data", "content")
+_MISSING = object()
+
+
+@lru_cache(maxsize=128)
+def _compile_jmespath(expression: str) -> Any:
+    """Compiles a --cx-query expression once; pipelines reuse the same few."""
+    return jmespath.compile(expression)
+
+
+_token_value = attrgetter("value")
+
+
+# These commands accept a fixed set of flags, so each flag is mapped to its
+# argument name with a table lookup and unknown flags are rejected up front.
+_COMPILE_FLAGS = {
+    "--spec-url": "spec_source",
+    "--name": "name",
+    "--version": "version",
+    "--namespace": "namespace",
+}
+_CONNECTION_CREATE_FLAGS = {"--blueprint": "blueprint"}
+# AppManager.install reads the flags as given.
+_APP_INSTALL_FLAGS = {"--id": "--id", "--path": "--path", "--url": "--url"}
+
+
+def _map_flags(
+    command: str, flags: Dict[str, str], named_args: Tuple[Tuple[str, Any], ...]
+) -> Dict[str, Any]:
+    args = {}
+    for flag, value in named_args:
+        key = flags.get(flag)
+        if key is None:
+            raise ValueError(
+                f"Unknown flag '{flag}' for '{command}'. Expected one of: {', '.join(flags)}."
+            )
+        args[key] = value
+    return args
 
-    def expression(self, pipeline):
-        return pipeline
 
-    def pipeline(self, *items):
-        clean_commands = [item for item in items if isinstance(item, tuple)]
-        return PipelineCommand(clean_commands)
+@lru_cache(maxsize=256)
+def _clean_flag(flag: str) -> str:
+    """Strips the leading dashes from a flag; the set of flags is small."""
+    return flag.lstrip("-")
 
-    def command_unit(self, executable, formatter=None):
-        return (executable, dict(formatter or []))
 
-    def executable(self, exec_obj):
-        return exec_obj
+def _token_text(text: str) -> str:
+    return text
 
-    def single_executable(self, exec_obj):
-        return exec_obj
 
-    def assignment(self, var_name, expression):
-        return AssignmentCommand(var_name.value, expression)
+# Converts a value token's text by token type; anything else (e.g. the results
+# of the true/false/null rules) is passed through unchanged.
+_VALUE_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    "JINJA_BLOCK": _token_text,
+    "STRING": _string_literal,
+    "NUMBER": _number_literal,
+    "ARG": _token_text,
+    "CNAME": _token_text,
+}
 
-    def single_command(self, command):
-        return command
 
-    def builtin_command(self, cmd):
-        return cmd
+@v_args(inline=True)
+class CommandTransformer(Transformer_NonRecursive):
+    """Transforms the Lark parse tree into our executable Command objects."""
+
+    def pipeline(self, *command_units):
+        # "|" is an anonymous terminal, so the tree only carries command units.
+        return PipelineCommand(list(command_units))
+
+    def command_unit(self, executable, formatter=None):
+        return (executable, dict(formatter) if formatter else {})
+
+    def assignment(self, var_name, expression):
+        return AssignmentCommand(var_name.value, expression)
 
     def variable_lookup(self, var_name):
         return VariableLookup(var_name.value)
@@ -101,9 +341,6 @@ class CommandTransformer(Transformer):
     def formatter(self, *options):
         return options
 
-    def formatter_option(self, option):
-        return option
-
     def output_option(self, mode):
         return ("output_mode", mode.value)
 
@@ -111,19 +348,28 @@ class CommandTransformer(Transformer):
         return ("columns", columns)
 
     def query_option(self, query_str):
-        return ("query", literal_eval(query_str.value))
+        return ("query", _string_literal(query_str.value))
 
     def column_list(self, *cols):
-        return [c.value for c in cols]
+        return list(map(_token_value, cols))
 
     def dot_notation_command(self, alias, action_name, arg_block=None):
         if isinstance(arg_block, dict) or arg_block is None:
-            return DotNotationCommand(alias.value, action_name.value, arg_block or {})
+            return DotNotationCommand(
+                sys.intern(alias.value), action_name.value, arg_block or {}
+            )
         else:
-            return PositionalArgActionCommand(alias.value, action_name.value, arg_block)
+            return PositionalArgActionCommand(
+                sys.intern(alias.value), action_name.value, arg_block
+            )
 
-    def connect_command(self, source, alias):
-        return BuiltinCommand(["connect", source.value, "--as", alias.value])
+    def connect_command(self, *targets):
+        return ConnectCommand(list(targets))
+
+    def connect_target(self, source, alias):
+        # Interned where aliases enter the shell, so session lookups by alias
+        # compare identical string objects.
+        return (sys.intern(source.value), sys.intern(alias.value))
 
     def connections_command(self):
         return BuiltinCommand(["connections"])
@@ -135,74 +381,42 @@ class CommandTransformer(Transformer):
         return InspectCommand(var_name.value)
 
     def agent_command(self, goal):
-        return AgentCommand(literal_eval(goal.value))
-
-    def session_command(self, cmd_obj):
-        return cmd_obj
-
-    def session_subcommand(self, cmd_obj):
-        return cmd_obj
-
-    def variable_command(self, cmd_obj):
-        return cmd_obj
-
-    def variable_subcommand(self, cmd_obj):
-        return cmd_obj
-
-    def flow_command(self, cmd_obj):
-        return cmd_obj
-
-    def query_command(self, cmd_obj):
-        return cmd_obj
-
-    def script_command(self, cmd_obj):
-        return cmd_obj
-
-    def connection_command(self, cmd_obj):
-        return cmd_obj
-
-    def open_command(self, cmd_obj):
-        return cmd_obj
-
-    def app_command(self, cmd_obj):
-        return cmd_obj
-
-    def app_subcommand(self, cmd_obj):
-        return cmd_obj
-
-    def compile_command(self, cmd_obj):
-        return cmd_obj
-
-    def process_command(self, cmd_obj):
-        return cmd_obj
-
-    def process_subcommand(self, cmd_obj):
-        return cmd_obj
+        return AgentCommand(_string_literal(goal.value))
 
     def open_args(self, *args):
-        return list(args)
+        return args
 
     def open_command_handler(self, open_args=None):
-        args = open_args or []
-        positional_args = [
-            arg.value
-            for arg in args
-            if hasattr(arg, "type") and arg.type in ("ARG", "JINJA_BLOCK")
-        ]
-        named_args_list = [arg for arg in args if isinstance(arg, tuple)]
+        # open_args only holds ARG/JINJA_BLOCK tokens and named_argument
+        # tuples, so one pass sorts them without per-item hasattr probes.
+        positional_args = []
+        args_dict = {}
+        for arg in open_args or ():
+            if type(arg) is tuple:
+                args_dict[_clean_flag(arg[0])] = arg[1]
+            else:
+                positional_args.append(arg.value)
         asset_type = positional_args[0] if positional_args else None
         asset_name = positional_args[1] if len(positional_args) > 1 else None
-        args_dict = {key.lstrip("-"): value for key, value in named_args_list}
         return OpenCommand(asset_type, asset_name, args_dict)
 
     def connection_create(self, *named_args):
-        return ConnectionCommand("create", named_args=dict(named_args))
+        return ConnectionCommand(
+            "create",
+            named_args=_map_flags(
+                "connection create", _CONNECTION_CREATE_FLAGS, named_args
+            ),
+        )
 
     def compile_command_with_args(self, *named_args):
-        return CompileCommand(named_args=dict(named_args))
+        return CompileCommand(
+            named_args=_map_flags("compile", _COMPILE_FLAGS, named_args)
+        )
 
     def app_install(self, *named_args):
-        return AppCommand("install", args=dict(named_args))
+        return AppCommand(
+            "install", args=_map_flags("app install", _APP_INSTALL_FLAGS, named_args)
+        )
 
     def session_list(self):
         return SessionCommand("list")
@@ -261,30 +475,27 @@ class CommandTransformer(Transformer):
     def process_stop(self, arg):
         return ProcessCommand("stop", arg.value)
 
-    def workspace_command(self, cmd_obj):
-        return cmd_obj
-
-    def workspace_subcommand(self, cmd_obj):
-        return cmd_obj
-
     def workspace_list(self):
-        return WorkspaceCommand("list")
+        return WorkspaceCommand("list", {})
 
     def workspace_add(self, path):
-        return WorkspaceCommand("add", path.value)
+        return WorkspaceCommand("add", {"path": path.value})
 
     def workspace_remove(self, path):
-        return WorkspaceCommand("remove", path.value)
+        return WorkspaceCommand("remove", {"path": path.value})
 
     def workspace_index(self, *named_args):
         # --- FIX: Strip the prefix from the key ---
-        return WorkspaceCommand("index", args={k.lstrip("-"): v for k, v in named_args})
+        return WorkspaceCommand(
+            "index", args={_clean_flag(k): v for k, v in named_args}
+        )
 
     def find_command(self, *args):
         # The *args from Lark will contain all matched items (Tokens and Tuples).
-        logger.debug("transformer.find_command.received_args", args=args)
+        if __debug__:
+            logger.debug("transformer.find_command.received_args", args=args)
 
-        items = list(args)
+        items = args
 
         query = next(
             (
@@ -295,11 +506,11 @@ class CommandTransformer(Transformer):
             None,
         )
         if query:
-            query = literal_eval(query)
+            query = _string_literal(query)
 
         # This comprehension correctly handles named arguments (which are tuples)
         named_args = {
-            item[0].lstrip("-"): (
+            _clean_flag(item[0]): (
                 item[1].value if hasattr(item[1], "value") else item[1]
             )
             for item in items
@@ -308,7 +519,7 @@ class CommandTransformer(Transformer):
 
         return FindCommand(query=query, args=named_args)
 
-    def _process_run_args(self, *args):
+    def _process_run_args(self, args):
         """
         Processes a list of (key, value) tuples from the parser into a clean
         dictionary suitable for the command managers. It separates structural
@@ -319,7 +530,7 @@ class CommandTransformer(Transformer):
         for k, v in args:
             if k.startswith("--"):
                 # This is a structural flag (e.g., --name, --on)
-                named_args[k.lstrip("-")] = v
+                named_args[_clean_flag(k)] = v
             else:
                 # This is a user-defined parameter (e.g., status=Booked)
                 params[k] = v
@@ -327,13 +538,13 @@ class CommandTransformer(Transformer):
         return named_args
 
     def flow_run(self, *args):
-        return FlowCommand("run", named_args=self._process_run_args(*args))
+        return FlowCommand("run", named_args=self._process_run_args(args))
 
     def query_run(self, *args):
-        return QueryCommand("run", named_args=self._process_run_args(*args))
+        return QueryCommand("run", named_args=self._process_run_args(args))
 
     def script_run(self, *args):
-        return ScriptCommand("run", named_args=self._process_run_args(*args))
+        return ScriptCommand("run", named_args=self._process_run_args(args))
 
     def arguments(self, *args):
         return dict(args)
@@ -353,7 +564,7 @@ class CommandTransformer(Transformer):
         if value is not None:
             # Check if the value is a Lark Token and if its type is STRING
             if hasattr(value, "type") and value.type == "STRING":
-                final_value = literal_eval(value.value)
+                final_value = _string_literal(value.value)
             # Handle other token types that have a .value attribute
             elif hasattr(value, "value"):
                 final_value = value.value
@@ -363,16 +574,8 @@ class CommandTransformer(Transformer):
         return (flag.value, final_value)
 
     def value(self, v):
-        if hasattr(v, "type"):
-            if v.type == "JINJA_BLOCK":
-                return v.value
-            if v.type in ("STRING", "NUMBER"):
-                return literal_eval(v.value)
-            if v.type == "ARG":
-                return v.value
-            if v.type == "CNAME":
-                return v.value
-        return v
+        convert = _VALUE_CONVERTERS.get(getattr(v, "type", None))
+        return convert(v.value) if convert else v
 
     def true(self, _):
         return True
@@ -384,40 +587,320 @@ class CommandTransformer(Transformer):
         return None
 
 
+def _parse_tree(command_text: str) -> Tree:
+    return CommandExecutor._get_parser()[0].parse(command_text)
+
+
+# Recalled history lines and agent retries re-submit identical text, so the
+# parse trees are memoized. Only the trees are cached: transform() still builds
+# fresh command objects per call, so nothing mutable is shared between runs.
+# Set CX_PARSE_CACHE=0 to turn this off.
+if os.getenv("CX_PARSE_CACHE", "1") != "0":
+    _parse_tree = lru_cache(maxsize=512)(_parse_tree)
+
+
+def _command_executed() -> Dict[str, str]:
+    return {"status": "success", "message": "Command executed."}
+
+
+# Executor methods keyed on (command type, subcommand), so dispatch is a single
+# dict lookup. A None subcommand is the fallback for the type. Run handlers
+# produce data under a status spinner; management handlers return None when
+# they print their own output. Dry-run handlers simulate a command type that
+# has more to check than its syntax.
+_RUN_HANDLERS: Dict[tuple, Callable] = {}
+_MANAGEMENT_HANDLERS: Dict[tuple, Callable] = {}
+_DRY_RUN_HANDLERS: Dict[tuple, Callable] = {}
+
+
+def _handles(
+    registry: Dict[tuple, Callable],
+    command_type: type,
+    subcommand: Optional[str] = None,
+) -> Callable:
+    def decorator(handler: Callable) -> Callable:
+        registry[(command_type, subcommand)] = handler
+        return handler
+
+    return decorator
+
+
+_run_handler = partial(_handles, _RUN_HANDLERS)
+_management_handler = partial(_handles, _MANAGEMENT_HANDLERS)
+_dry_run_handler = partial(_handles, _DRY_RUN_HANDLERS)
+
+
+@lru_cache(maxsize=None)
+def _build_help_renderables() -> tuple:
+    """Builds the help screen once; `help` reprints the same renderables."""
+    # Imported here so sessions that never render a table skip loading it.
+    from rich.table import Table
+
+    title = Panel(
+        "[bold yellow]Welcome to the Contextual Shell (`cx`) v0.2.0[/bold yellow]",
+        expand=False,
+        border_style="yellow",
+    )
+    builtins_table = Table(
+        title="[bold cyan]Core Commands[/bold cyan]",
+        box=box.MINIMAL,
+        padding=(0, 1),
+    )
+    builtins_table.add_column("Command", style="yellow", no_wrap=True)
+    builtins_table.add_column("Description")
+    builtins_table.add_row(
+        "connect <source> --as <alias>[, ...]",
+        "Activate one or more connections for the current session (e.g., `connect user:github --as gh`).",
+    )
+    builtins_table.add_row(
+        "connections", "List all active connections in the current session."
+    )
+    builtins_table.add_row("exit | quit", "Exit the interactive shell.")
+    builtins_table.add_row("help", "Show this help message.")
+    assets_table = Table(
+        title="[bold cyan]Workspace Asset Management[/bold cyan]",
+        box=box.MINIMAL,
+        padding=(0, 1),
+    )
+    assets_table.add_column("Command", style="yellow", no_wrap=True)
+    assets_table.add_column("Description")
+    assets_table.add_row(
+        "session [list|save|load|rm|status]",
+        "Manage persistent workspace sessions.",
+    )
+    assets_table.add_row("var [list|rm]", "Manage in-memory session variables.")
+    assets_table.add_row(
+        "flow [list|run]", "Manage and run reusable `.flow.yaml` workflows."
+    )
+    assets_table.add_row("query [list|run]", "Manage and run reusable `.sql` queries.")
+    assets_table.add_row("script [list|run]", "Manage and run reusable `.py` scripts.")
+    assets_table.add_row(
+        "connection [list|create]",
+        "Manage the connection configuration files on disk.",
+    )
+    assets_table.add_row(
+        "open <type> [name] [--in <handler>]",
+        "Open assets in their default or a specified application (e.g., `open flow my-flow --in vscode`).",
+    )
+    assets_table.add_row(
+        "inspect <variable>", "Display a detailed summary of a session variable."
+    )
+    execution_table = Table(
+        title="[bold cyan]Execution & Formatting[/bold cyan]",
+        box=box.MINIMAL,
+        padding=(0, 1),
+    )
+    execution_table.add_column("Syntax", style="yellow", no_wrap=True)
+    execution_table.add_column("Description")
+    execution_table.add_row(
+        "<alias>.<action>(...)",
+        "Execute a blueprint-defined action on a connection.",
+    )
+    execution_table.add_row(
+        "<command> | <command>",
+        "Pipe the output of one command to the input of the next.",
+    )
+    execution_table.add_row(
+        "<variable> = <command>",
+        "Assign the result of a command to a session variable.",
+    )
+    execution_table.add_row(
+        "... --cx-output table", "Render the final output as a formatted table."
+    )
+    execution_table.add_row(
+        "... --cx-output json-compact",
+        "Print the final output as single-line JSON.",
+    )
+    execution_table.add_row(
+        "... --cx-columns <col1,col2>", "Select specific columns for table output."
+    )
+    execution_table.add_row(
+        "... --cx-query <jmespath>",
+        "Filter or reshape the final output using a JMESPath query.",
+    )
+    return title, builtins_table, assets_table, execution_table
+
+
 class CommandExecutor:
-    # [Constructor remains unchanged]
+    # The grammar is compiled once per process and shared by every executor
+    # (e.g. the server's per-session executors); the transformer is stateless.
+    _parser: ClassVar[Optional[Lark]] = None
+    _transformer: ClassVar[Optional[CommandTransformer]] = None
+    _parser_lock: ClassVar[threading.Lock] = threading.Lock()
+    # Dry runs fire while the user is typing, and long command lines can take a
+    # while to parse; a worker thread keeps the event loop free for keypresses
+    # and in-flight connection tests. Shared like the parser, so short-lived
+    # executors don't each leave a thread behind; it starts on first submit.
+    _parse_executor: ClassVar[ThreadPoolExecutor] = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="cx-parser"
+    )
+
+    # Managers and the connector service are imported and built on first use,
+    # so a single `help` or `var list` doesn't pay for the whole stack. The
+    # imports are plain statements so PyInstaller still bundles the modules;
+    # assigning the attribute (e.g. a mock in tests) replaces the component.
+    @cached_property
+    def service(self) -> "ConnectorService":
+        from ..engine.connector.service import ConnectorService
+
+        return ConnectorService()
+
+    @cached_property
+    def session_manager(self) -> "SessionManager":
+        from ..management.session_manager import SessionManager
+
+        return SessionManager()
+
+    @cached_property
+    def variable_manager(self) -> "VariableManager":
+        from ..management.variable_manager import VariableManager
+
+        return VariableManager()
+
+    @cached_property
+    def flow_manager(self) -> "FlowManager":
+        from ..management.flow_manager import FlowManager
+
+        return FlowManager()
+
+    @cached_property
+    def query_manager(self) -> "QueryManager":
+        from ..management.query_manager import QueryManager
+
+        return QueryManager()
+
+    @cached_property
+    def script_manager(self) -> "ScriptManager":
+        from ..management.script_manager import ScriptManager
+
+        return ScriptManager()
+
+    @cached_property
+    def connection_manager(self) -> "ConnectionManager":
+        from ..management.connection_manager import ConnectionManager
+
+        return ConnectionManager()
+
+    @cached_property
+    def open_manager(self) -> "OpenManager":
+        from ..management.open_manager import OpenManager
+
+        return OpenManager()
+
+    @cached_property
+    def app_manager(self) -> "AppManager":
+        from ..management.app_manager import AppManager
+
+        return AppManager()
+
+    @cached_property
+    def process_manager(self) -> "ProcessManager":
+        from ..management.process_manager import ProcessManager
+
+        return ProcessManager()
+
+    @cached_property
+    def compile_manager(self) -> "CompileManager":
+        from ..management.compile_manager import CompileManager
+
+        return CompileManager()
+
+    @cached_property
+    def workspace_manager(self) -> "WorkspaceManager":
+        from ..management.workspace_manager import WorkspaceManager
+
+        return WorkspaceManager()
+
+    @cached_property
+    def index_manager(self) -> "IndexManager":
+        from ..management.index_manager import IndexManager
+
+        return IndexManager()
+
+    @cached_property
+    def find_manager(self) -> "FindManager":
+        from ..management.find_manager import FindManager
+
+        return FindManager()
+
     def __init__(self, state: SessionState, output_handler: IOutputHandler):
         self.state = state
         self.output_handler = output_handler
-        self.service = ConnectorService()
-        self.session_manager = SessionManager()
-        self.variable_manager = VariableManager()
-        self.flow_manager = FlowManager()
-        self.query_manager = QueryManager()
-        self.script_manager = ScriptManager()
-        self.connection_manager = ConnectionManager()
-        self.open_manager = OpenManager()
-        self.app_manager = AppManager()
-        self.process_manager = ProcessManager()
-        self.compile_manager = CompileManager()
-        self.workspace_manager = WorkspaceManager()
-        self.index_manager = IndexManager()
-        self.find_manager = FindManager()
+        # (handler, is_async) per builtin; asyncness is checked once here
+        # rather than on every dispatch.
         self.builtin_commands = {
-            "connect": self.execute_connect,
-            "connections": self.execute_list_connections,
-            "help": self.execute_help,
+            name: (handler, inspect.iscoroutinefunction(handler))
+            for name, handler in (
+                ("connections", self.execute_list_connections),
+                ("help", self.execute_help),
+            )
         }
-        self._orchestrator: Optional[AgentOrchestrator] = None
-        pkg_root = get_pkg_root()
-        grammar_path = pkg_root / "interactive" / "grammar" / "cx.lark"
-        with open(grammar_path, "r", encoding="utf-8") as f:
-            self.parser = Lark(f.read(), start="start", parser="lalr")
-        self.transformer = CommandTransformer()
+        self._orchestrator: Optional["AgentOrchestrator"] = None
+        # Resolved (files version, connection, secrets, strategy) per connection
+        # source, reused across dry runs so validation doesn't re-read connection
+        # files each time; an edited connection or secrets file is re-resolved.
+        self._dry_run_pool: "OrderedDict[str, tuple]" = OrderedDict()
+        # Off-screen console used to render large tables in one pass, so the
+        # terminal receives a single write instead of one per row.
+        self._render_console: Optional[Console] = None
+        # (terminal width, rendered text) of the last help screen.
+        self._help_output: Optional[Tuple[int, str]] = None
+        # source -> monotonic time of its last successful connection test.
+        self._connection_probes: Dict[str, float] = {}
+        self._inflight_dry_runs: Dict[str, asyncio.Task] = {}
+        # Transformed commands (or syntax-error results) per dry-run text. Dry
+        # runs only read them, so unlike execute() they can be shared between
+        # calls; this skips the parser thread hop and the transform on
+        # repeated validations.
+        self._dry_run_commands: "OrderedDict[str, Any]" = OrderedDict()
+        # Build and warm the shared parser in the background while the shell
+        # starts up; a command issued meanwhile waits on the parser lock. Later
+        # executors in the same process find it built and skip the hop.
+        if self._parser is None and not os.getenv("CX_NO_PREWARM"):
+            self._parse_executor.submit(self._get_parser)
+
+    @classmethod
+    def _get_parser(cls) -> Tuple[Lark, CommandTransformer]:
+        """Builds the shared parser and transformer on first use."""
+        if cls._parser is None:
+            with cls._parser_lock:
+                if cls._parser is None:
+                    # The cached LALR tables skip grammar compilation on startup;
+                    # an unwritable CX_HOME only costs that, not the parser.
+                    cache = str(PARSER_CACHE_FILE)
+                    try:
+                        PARSER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                    except OSError:
+                        cache = False
+                    parser = _build_lark(cache)
+                    transformer = CommandTransformer()
+                    # Run a couple of trivial commands so Lark's lazily built
+                    # lexer/parser state exists before the user's first one.
+                    for probe in ("help", "connections"):
+                        try:
+                            transformer.transform(parser.parse(probe))
+                        except LarkError:
+                            pass
+                    cls._transformer = transformer
+                    cls._parser = parser
+        return cls._parser, cls._transformer
 
     @property
-    def orchestrator(self) -> AgentOrchestrator:
+    def parser(self) -> Lark:
+        return self._get_parser()[0]
+
+    @property
+    def transformer(self) -> CommandTransformer:
+        return self._get_parser()[1]
+
+    def _parse(self, command_text: str) -> PipelineCommand:
+        return self.transformer.transform(_parse_tree(command_text))
+
+    @property
+    def orchestrator(self) -> "AgentOrchestrator":
         if self._orchestrator is None:
+            from .agent_orchestrator import AgentOrchestrator
+
             logger.debug("executor.lazy_load", component="AgentOrchestrator")
             self._orchestrator = AgentOrchestrator(self.state, self)
         return self._orchestrator
@@ -425,18 +908,28 @@ class CommandExecutor:
     async def execute(
         self, command_text: str, piped_input: Any = None
     ) -> Optional[SessionState]:
-        # [This method remains unchanged]
-        if not command_text.strip():
+        # Blank and comment lines (e.g. from a script fed line by line, where
+        # comments may be indented) never reach the parser.
+        stripped = command_text.lstrip()
+        if not stripped or stripped[0] == "#":
             return None
         try:
-            tree = self.parser.parse(command_text)
-            pipeline_command = self.transformer.transform(tree)
-            logger.debug(
-                "executor.parsed_pipeline",
-                pipeline=[
-                    (type(cmd[0]).__name__, cmd[1]) for cmd in pipeline_command.commands
-                ],
-            )
+            if len(command_text) > THREADED_PARSE_MIN_LENGTH:
+                # Long lines (usually generated or scripted) parse on the worker
+                # thread so in-flight I/O keeps moving on the event loop.
+                pipeline_command = await asyncio.get_running_loop().run_in_executor(
+                    self._parse_executor, self._parse, command_text
+                )
+            else:
+                pipeline_command = self._parse(command_text)
+            if __debug__ and _debug_enabled():
+                logger.debug(
+                    "executor.parsed_pipeline",
+                    pipeline=[
+                        (type(cmd[0]).__name__, cmd[1])
+                        for cmd in pipeline_command.commands
+                    ],
+                )
             first_executable, _ = pipeline_command.commands[0]
             is_assignment = isinstance(first_executable, AssignmentCommand)
             final_result = None
@@ -444,9 +937,12 @@ class CommandExecutor:
                 command_to_run, formatter_options = (
                     first_executable.command_to_run.commands[0]
                 )
-                raw_result = await self._execute_executable(
-                    command_to_run, piped_input=piped_input
-                )
+                if type(command_to_run) is VariableLookup:
+                    raw_result = self._lookup_variable(command_to_run, piped_input)
+                else:
+                    raw_result = await self._execute_executable(
+                        command_to_run, piped_input=piped_input
+                    )
                 processed_result = self._apply_formatters(raw_result, formatter_options)
                 if not (
                     isinstance(processed_result, dict) and "error" in processed_result
@@ -458,9 +954,15 @@ class CommandExecutor:
             else:
                 current_input = piped_input
                 for command_to_run, formatter_options in pipeline_command.commands:
-                    raw_result = await self._execute_executable(
-                        command_to_run, piped_input=current_input
-                    )
+                    # Variable lookups do no I/O, so they skip the coroutine.
+                    if type(command_to_run) is VariableLookup:
+                        raw_result = self._lookup_variable(
+                            command_to_run, current_input
+                        )
+                    else:
+                        raw_result = await self._execute_executable(
+                            command_to_run, piped_input=current_input
+                        )
                     current_input = self._apply_formatters(
                         raw_result, formatter_options
                     )
@@ -485,316 +987,337 @@ class CommandExecutor:
         return None
 
     def _apply_formatters(self, raw_result: Any, formatter_options: Dict) -> Any:
-        # [This method remains unchanged]
         if not formatter_options:
             if isinstance(raw_result, dict):
-                for key in ["results", "data", "content"]:
-                    if key in raw_result:
-                        val = raw_result[key]
-                        if key == "content":
+                for key in _UNWRAP_KEYS:
+                    val = raw_result.get(key, _MISSING)
+                    if val is not _MISSING:
+                        # Only text can hold JSON; already-decoded content
+                        # skips the raise-and-catch in orjson.
+                        if key == "content" and isinstance(val, (str, bytes)):
                             try:
-                                val = json.loads(val)
-                            except (json.JSONDecodeError, TypeError):
+                                val = orjson.loads(val)
+                            except orjson.JSONDecodeError:
                                 pass
                         return val
             return raw_result
         processed_result = raw_result
         if "query" in formatter_options:
-            processed_result = jmespath.search(
-                formatter_options["query"], processed_result
+            processed_result = _compile_jmespath(formatter_options["query"]).search(
+                processed_result
             )
         return processed_result
 
     async def _execute_executable(
         self, executable: Any, piped_input: Any = None
     ) -> Any:
-        # [This method remains unchanged]
-        logger.debug(
-            "executor.dispatch.begin",
-            executable_type=type(executable).__name__,
-            has_piped_input=piped_input is not None,
-        )
-        if isinstance(executable, VariableLookup):
-            if executable.var_name not in self.state.variables:
-                raise ValueError(f"Variable '{executable.var_name}' not found.")
-            if piped_input is not None:
-                raise ValueError("Cannot pipe data into a variable lookup.")
-            return self.state.variables[executable.var_name]
-        if isinstance(executable, Command):
-            is_data_producing_command = getattr(
-                executable, "subcommand", None
-            ) == "run" or isinstance(
-                executable, (DotNotationCommand, PositionalArgActionCommand)
-            )
-            if is_data_producing_command:
-                with console.status("Executing command...", spinner="dots") as status:
-                    logger.debug(
-                        "executor.run_command.begin",
-                        command_type=type(executable).__name__,
-                        args=getattr(executable, "named_args", None)
-                        or getattr(executable, "args", {}),
-                    )
-                    if isinstance(executable, FlowCommand):
-                        status.update(
-                            f"Running flow '{executable.named_args.get('name')}'..."
-                        )
-                        return await self.flow_manager.run_flow(
-                            self.state, self.service, executable.named_args
-                        )
-                    if isinstance(executable, QueryCommand):
-                        status.update(
-                            f"Running query '{executable.named_args.get('name')}' on '{executable.named_args.get('on')}'..."
-                        )
-                        return await self.query_manager.run_query(
-                            self.state, self.service, executable.named_args
-                        )
-                    if isinstance(executable, ScriptCommand):
-                        status.update(
-                            f"Running script '{executable.named_args.get('name')}'..."
-                        )
-                        return await self.script_manager.run_script(
-                            self.state, self.service, executable.named_args, piped_input
-                        )
-                    if isinstance(
-                        executable, (DotNotationCommand, PositionalArgActionCommand)
-                    ):
-                        return await executable.execute(
-                            self.state, self.service, status, piped_input=piped_input
-                        )
-            else:
-                return await self._dispatch_management_command(
-                    executable, piped_input=piped_input
-                )
-        raise TypeError(f"Cannot execute object of type: {type(executable).__name__}")
-
-    async def _dispatch_management_command(
-        self, command: Command, piped_input: Any = None
-    ) -> Any:
-        # [This method remains unchanged]
-        if hasattr(command, "subcommand") and command.subcommand == "list":
-            if isinstance(command, ConnectionCommand):
-                return self.connection_manager.list_connections()
-            if isinstance(command, FlowCommand):
-                return self.flow_manager.list_flows()
-            if isinstance(command, QueryCommand):
-                return self.query_manager.list_queries()
-            if isinstance(command, ScriptCommand):
-                return self.script_manager.list_scripts()
-            if isinstance(command, SessionCommand):
-                return self.session_manager.list_sessions()
-            if isinstance(command, VariableCommand):
-                return self.variable_manager.list_variables(self.state)
-            if isinstance(command, AppCommand):
-                return await self.app_manager.list_installed_apps()
-            if isinstance(command, ProcessCommand):
-                return self.process_manager.list_processes()
-        if isinstance(command, AppCommand) and command.subcommand == "search":
-            return await self.app_manager.search(command.args.get("query"))
-        if isinstance(command, InspectCommand):
-            return await command.execute(self.state, self.service, None)
-        if isinstance(command, BuiltinCommand) and command.command == "connections":
-            return [
-                {"Alias": alias, "Source": source}
-                for alias, source in self.state.connections.items()
-            ]
-
-        command_prints_own_output = False
-        simple_confirmation_message = None
-        if isinstance(command, BuiltinCommand):
-            command_prints_own_output = True
-            handler = self.builtin_commands.get(command.command)
-            if handler:
-                await handler(command.args) if asyncio.iscoroutinefunction(
-                    handler
-                ) else handler(command.args)
-        elif isinstance(command, ConnectionCommand) and command.subcommand == "create":
-            await self.connection_manager.create_interactive(
-                command.named_args.get("blueprint")
+        executable_type = type(executable)
+        debug = __debug__ and _debug_enabled()
+        if debug:
+            logger.debug(
+                "executor.dispatch.begin",
+                executable_type=executable_type.__name__,
+                has_piped_input=piped_input is not None,
             )
-            command_prints_own_output = True
-        elif isinstance(command, AppCommand):
-            command_prints_own_output = True
-            if command.subcommand == "install":
-                await self.app_manager.install(command.args)
-            elif command.subcommand == "uninstall":
-                await self.app_manager.uninstall(command.args["id"])
-            elif command.subcommand == "package":
-                await self.app_manager.package(command.args["path"])
-        elif isinstance(command, SessionCommand):
-            if command.subcommand == "status":
-                self.session_manager.show_status(self.state)
-                command_prints_own_output = True
-            elif command.subcommand == "save":
-                simple_confirmation_message = self.session_manager.save_session(
-                    self.state, command.arg
-                )
-            elif command.subcommand == "rm":
-                simple_confirmation_message = await self.session_manager.delete_session(
-                    command.arg
+        if executable_type is VariableLookup:
+            return self._lookup_variable(executable, piped_input)
+        run_handler = _RUN_HANDLERS.get(
+            (executable_type, getattr(executable, "subcommand", None))
+        )
+        if run_handler is None:
+            # Only registered Command types can hit the table, so the type check
+            # is needed on the fallback path alone.
+            if not isinstance(executable, Command):
+                raise TypeError(
+                    f"Cannot execute object of type: {executable_type.__name__}"
                 )
-            elif command.subcommand == "load":
-                return self.session_manager.load_session(command.arg)
-        elif isinstance(command, VariableCommand) and command.subcommand == "rm":
-            simple_confirmation_message = self.variable_manager.delete_variable(
-                self.state, command.arg
-            )
-        elif isinstance(command, OpenCommand):
-            command_prints_own_output = True
-            handler = command.named_args.get("in", "default")
-            on_alias = command.named_args.get("on")
-            await self.open_manager.open_asset(
-                self.state,
-                self.service,
-                command.asset_type,
-                command.asset_name,
-                handler,
-                on_alias,
-                piped_input=piped_input,
+            return await self._dispatch_management_command(
+                executable, piped_input=piped_input
             )
-        elif isinstance(command, ProcessCommand) and command.subcommand == "logs":
-            command_prints_own_output = True
-            self.process_manager.get_logs(command.arg, command.follow)
-        elif isinstance(command, CompileCommand):
-            command_prints_own_output = True
-            await self.compile_manager.run_compile(**command.named_args)
-        elif isinstance(command, AgentCommand):
-            command_prints_own_output = True
-            await self.orchestrator.start_session(command.goal)
-        elif isinstance(command, WorkspaceCommand):
+        if debug:
             logger.debug(
-                "workspace.dispatch.begin",
-                subcommand=command.subcommand,
-                args=command.args,
+                "executor.run_command.begin",
+                command_type=executable_type.__name__,
+                args=getattr(executable, "named_args", None)
+                or getattr(executable, "args", {}),
             )
-            command_prints_own_output = True
-            if command.subcommand == "list":
-                self.workspace_manager.list_roots()
-            elif command.subcommand == "add":
-                self.workspace_manager.add_root(command.args["path"])
-            elif command.subcommand == "remove":
-                self.workspace_manager.remove_root(command.args["path"])
-            elif command.subcommand == "index":
-                # Now we check for the presence of the 'rebuild' key in the args dict.
-                if "rebuild" in command.args:
-                    self.index_manager.rebuild_index()
-                    console.print("✅ VFS Index rebuild complete.")
-                else:
-                    console.print(
-                        "Incremental indexing not yet implemented. Use `workspace index --rebuild`."
-                    )
-            return None
+        # Handlers may update the status message before the spinner is shown;
+        # an unstarted Status just keeps the latest message.
+        status = get_console().status("Executing command...", spinner="dots")
+        return await self._run_with_delayed_spinner(
+            run_handler(self, executable, status, piped_input), status
+        )
 
-        elif isinstance(command, FindCommand):
-            # This is a data-producing command
-            return self.find_manager.find_assets(
-                query=command.query,
-                asset_type=command.args.get("type"),
-                limit=int(command.args.get("limit", 10)),
-            )
-        if simple_confirmation_message:
-            return simple_confirmation_message
-        if command_prints_own_output:
-            return None
-        return {"status": "success", "message": "Command executed."}
+    def _lookup_variable(self, lookup: VariableLookup, piped_input: Any) -> Any:
+        if lookup.var_name not in self.state.variables:
+            raise ValueError(f"Variable '{lookup.var_name}' not found.")
+        if piped_input is not None:
+            raise ValueError("Cannot pipe data into a variable lookup.")
+        return self.state.variables[lookup.var_name]
 
-    def execute_help(self, args: List[str]):
-        # [Help text remains unchanged]
-        console.print()
-        title = Panel(
-            "[bold yellow]Welcome to the Contextual Shell (`cx`) v0.2.0[/bold yellow]",
-            expand=False,
-            border_style="yellow",
-        )
-        console.print(title)
-        console.print(
-            "\n`cx` is an interactive shell for managing workspace assets and running data workflows."
-        )
-        builtins_table = Table(
-            title="[bold cyan]Core Commands[/bold cyan]",
-            box=box.MINIMAL,
-            padding=(0, 1),
-        )
-        builtins_table.add_column("Command", style="yellow", no_wrap=True)
-        builtins_table.add_column("Description")
-        builtins_table.add_row(
-            "connect <source> --as <alias>",
-            "Activate a connection for the current session (e.g., `connect user:github --as gh`).",
-        )
-        builtins_table.add_row(
-            "connections", "List all active connections in the current session."
-        )
-        builtins_table.add_row("exit | quit", "Exit the interactive shell.")
-        builtins_table.add_row("help", "Show this help message.")
-        console.print(builtins_table)
-        assets_table = Table(
-            title="[bold cyan]Workspace Asset Management[/bold cyan]",
-            box=box.MINIMAL,
-            padding=(0, 1),
-        )
-        assets_table.add_column("Command", style="yellow", no_wrap=True)
-        assets_table.add_column("Description")
-        assets_table.add_row(
-            "session [list|save|load|rm|status]",
-            "Manage persistent workspace sessions.",
-        )
-        assets_table.add_row("var [list|rm]", "Manage in-memory session variables.")
-        assets_table.add_row(
-            "flow [list|run]", "Manage and run reusable `.flow.yaml` workflows."
-        )
-        assets_table.add_row(
-            "query [list|run]", "Manage and run reusable `.sql` queries."
-        )
-        assets_table.add_row(
-            "script [list|run]", "Manage and run reusable `.py` scripts."
+    async def _run_with_delayed_spinner(self, coro: Any, status: Any) -> Any:
+        """
+        Runs the command without a spinner and only starts one if it is still
+        running after SPINNER_DELAY, so fast commands skip Rich's live-render
+        thread and terminal writes entirely.
+        """
+        task = asyncio.ensure_future(coro)
+        try:
+            done, _ = await asyncio.wait({task}, timeout=SPINNER_DELAY)
+            if done:
+                return task.result()
+            with status:
+                return await task
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+
+    @_run_handler(FlowCommand, "run")
+    async def _run_flow(self, command: FlowCommand, status, piped_input: Any) -> Any:
+        status.update(f"Running flow '{command.named_args.get('name')}'...")
+        return await self.flow_manager.run_flow(
+            self.state, self.service, command.named_args
         )
-        assets_table.add_row(
-            "connection [list|create]",
-            "Manage the connection configuration files on disk.",
+
+    @_run_handler(QueryCommand, "run")
+    async def _run_query(self, command: QueryCommand, status, piped_input: Any) -> Any:
+        status.update(
+            f"Running query '{command.named_args.get('name')}' on '{command.named_args.get('on')}'..."
         )
-        assets_table.add_row(
-            "open <type> [name] [--in <handler>]",
-            "Open assets in their default or a specified application (e.g., `open flow my-flow --in vscode`).",
+        return await self.query_manager.run_query(
+            self.state, self.service, command.named_args
         )
-        assets_table.add_row(
-            "inspect <variable>", "Display a detailed summary of a session variable."
+
+    @_run_handler(ScriptCommand, "run")
+    async def _run_script(
+        self, command: ScriptCommand, status, piped_input: Any
+    ) -> Any:
+        status.update(f"Running script '{command.named_args.get('name')}'...")
+        return await self.script_manager.run_script(
+            self.state, self.service, command.named_args, piped_input
         )
-        console.print(assets_table)
-        execution_table = Table(
-            title="[bold cyan]Execution & Formatting[/bold cyan]",
-            box=box.MINIMAL,
-            padding=(0, 1),
+
+    @_run_handler(DotNotationCommand)
+    @_run_handler(PositionalArgActionCommand)
+    async def _run_action(self, command: Command, status, piped_input: Any) -> Any:
+        return await command.execute(
+            self.state, self.service, status, piped_input=piped_input
         )
-        execution_table.add_column("Syntax", style="yellow", no_wrap=True)
-        execution_table.add_column("Description")
-        execution_table.add_row(
-            "<alias>.<action>(...)",
-            "Execute a blueprint-defined action on a connection.",
+
+    async def _dispatch_management_command(
+        self, command: Command, piped_input: Any = None
+    ) -> Any:
+        command_type = type(command)
+        handler = _MANAGEMENT_HANDLERS.get(
+            (command_type, getattr(command, "subcommand", None))
+        ) or _MANAGEMENT_HANDLERS.get((command_type, None))
+        if handler is None:
+            return _command_executed()
+        result = handler(self, command, piped_input)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    @_management_handler(ConnectionCommand, "list")
+    def _connection_list(self, command: ConnectionCommand, piped_input: Any) -> Any:
+        return self.connection_manager.list_connections()
+
+    @_management_handler(FlowCommand, "list")
+    def _flow_list(self, command: FlowCommand, piped_input: Any) -> Any:
+        return self.flow_manager.list_flows()
+
+    @_management_handler(QueryCommand, "list")
+    def _query_list(self, command: QueryCommand, piped_input: Any) -> Any:
+        return self.query_manager.list_queries()
+
+    @_management_handler(ScriptCommand, "list")
+    def _script_list(self, command: ScriptCommand, piped_input: Any) -> Any:
+        return self.script_manager.list_scripts()
+
+    @_management_handler(SessionCommand, "list")
+    def _session_list(self, command: SessionCommand, piped_input: Any) -> Any:
+        return self.session_manager.list_sessions()
+
+    @_management_handler(SessionCommand, "load")
+    def _session_load(self, command: SessionCommand, piped_input: Any) -> Any:
+        return self.session_manager.load_session(command.arg)
+
+    @_management_handler(VariableCommand, "list")
+    def _variable_list(self, command: VariableCommand, piped_input: Any) -> Any:
+        return self.variable_manager.list_variables(self.state)
+
+    @_management_handler(AppCommand, "list")
+    async def _app_list(self, command: AppCommand, piped_input: Any) -> Any:
+        return await self.app_manager.list_installed_apps()
+
+    @_management_handler(AppCommand, "search")
+    async def _app_search(self, command: AppCommand, piped_input: Any) -> Any:
+        return await self.app_manager.search(command.args.get("query"))
+
+    @_management_handler(AppCommand)
+    def _app_unhandled(self, command: AppCommand, piped_input: Any) -> None:
+        return None
+
+    @_management_handler(ProcessCommand, "list")
+    def _process_list(self, command: ProcessCommand, piped_input: Any) -> Any:
+        return self.process_manager.list_processes()
+
+    @_management_handler(InspectCommand)
+    async def _inspect(self, command: InspectCommand, piped_input: Any) -> Any:
+        return await command.execute(self.state, self.service, None)
+
+    @_management_handler(BuiltinCommand)
+    async def _run_builtin(self, command: BuiltinCommand, piped_input: Any) -> Any:
+        if command.command == "connections":
+            return [
+                {"Alias": alias, "Source": source}
+                for alias, source in self.state.connections.items()
+            ]
+        builtin = self.builtin_commands.get(command.command)
+        if builtin:
+            handler, is_async = builtin
+            await handler(command.args) if is_async else handler(command.args)
+        return None
+
+    @_management_handler(ConnectCommand)
+    async def _run_connect(self, command: ConnectCommand, piped_input: Any) -> None:
+        await self.execute_connect(command.targets)
+
+    @_management_handler(ConnectionCommand, "create")
+    async def _create_connection(
+        self, command: ConnectionCommand, piped_input: Any
+    ) -> None:
+        await self.connection_manager.create_interactive(
+            command.named_args.get("blueprint")
         )
-        execution_table.add_row(
-            "<command> | <command>",
-            "Pipe the output of one command to the input of the next.",
+
+    @_management_handler(AppCommand, "install")
+    async def _app_install(self, command: AppCommand, piped_input: Any) -> None:
+        await self.app_manager.install(command.args)
+
+    @_management_handler(AppCommand, "uninstall")
+    async def _app_uninstall(self, command: AppCommand, piped_input: Any) -> None:
+        await self.app_manager.uninstall(command.args["id"])
+
+    @_management_handler(AppCommand, "package")
+    async def _app_package(self, command: AppCommand, piped_input: Any) -> None:
+        await self.app_manager.package(command.args["path"])
+
+    @_management_handler(SessionCommand, "status")
+    def _session_status(self, command: SessionCommand, piped_input: Any) -> None:
+        self.session_manager.show_status(self.state)
+
+    @_management_handler(SessionCommand, "save")
+    def _session_save(self, command: SessionCommand, piped_input: Any) -> Any:
+        return (
+            self.session_manager.save_session(self.state, command.arg)
+            or _command_executed()
         )
-        execution_table.add_row(
-            "<variable> = <command>",
-            "Assign the result of a command to a session variable.",
+
+    @_management_handler(SessionCommand, "rm")
+    async def _session_rm(self, command: SessionCommand, piped_input: Any) -> Any:
+        return (
+            await self.session_manager.delete_session(command.arg)
+            or _command_executed()
         )
-        execution_table.add_row(
-            "... --cx-output table", "Render the final output as a formatted table."
+
+    @_management_handler(VariableCommand, "rm")
+    def _variable_rm(self, command: VariableCommand, piped_input: Any) -> Any:
+        return (
+            self.variable_manager.delete_variable(self.state, command.arg)
+            or _command_executed()
         )
-        execution_table.add_row(
-            "... --cx-columns <col1,col2>", "Select specific columns for table output."
+
+    @_management_handler(OpenCommand)
+    async def _open_asset(self, command: OpenCommand, piped_input: Any) -> None:
+        handler = command.named_args.get("in", "default")
+        on_alias = command.named_args.get("on")
+        await self.open_manager.open_asset(
+            self.state,
+            self.service,
+            command.asset_type,
+            command.asset_name,
+            handler,
+            on_alias,
+            piped_input=piped_input,
         )
-        execution_table.add_row(
-            "... --cx-query <jmespath>",
-            "Filter or reshape the final output using a JMESPath query.",
+
+    @_management_handler(ProcessCommand, "logs")
+    def _process_logs(self, command: ProcessCommand, piped_input: Any) -> None:
+        self.process_manager.get_logs(command.arg, command.follow)
+
+    @_management_handler(CompileCommand)
+    async def _compile(self, command: CompileCommand, piped_input: Any) -> None:
+        await self.compile_manager.run_compile(**command.named_args)
+
+    @_management_handler(AgentCommand)
+    async def _start_agent(self, command: AgentCommand, piped_input: Any) -> None:
+        await self.orchestrator.start_session(command.goal)
+
+    @_management_handler(WorkspaceCommand, "list")
+    def _workspace_list(self, command: WorkspaceCommand, piped_input: Any) -> None:
+        self.workspace_manager.list_roots()
+
+    @_management_handler(WorkspaceCommand, "add")
+    def _workspace_add(self, command: WorkspaceCommand, piped_input: Any) -> None:
+        self.workspace_manager.add_root(command.args["path"])
+
+    @_management_handler(WorkspaceCommand, "remove")
+    def _workspace_remove(self, command: WorkspaceCommand, piped_input: Any) -> None:
+        self.workspace_manager.remove_root(command.args["path"])
+
+    @_management_handler(WorkspaceCommand, "index")
+    def _workspace_index(self, command: WorkspaceCommand, piped_input: Any) -> None:
+        console = get_console()
+        # Now we check for the presence of the 'rebuild' key in the args dict.
+        if "rebuild" in command.args:
+            self.index_manager.rebuild_index()
+            console.print("✅ VFS Index rebuild complete.")
+        else:
+            console.print(
+                "Incremental indexing not yet implemented. Use `workspace index --rebuild`."
+            )
+
+    @_management_handler(FindCommand)
+    def _find_assets(self, command: FindCommand, piped_input: Any) -> Any:
+        # This is a data-producing command
+        return self.find_manager.find_assets(
+            query=command.query,
+            asset_type=command.args.get("type"),
+            limit=int(command.args.get("limit", 10)),
         )
-        console.print(execution_table)
-        console.print()
+
+    def execute_help(self, args: List[str]):
+        # The help screen is static, so its rendered text is reused for as long
+        # as the terminal width stays the same.
+        console = get_console()
+        width = console.width
+        if self._help_output is None or self._help_output[0] != width:
+            title, builtins_table, assets_table, execution_table = (
+                _build_help_renderables()
+            )
+            self._help_output = (
+                width,
+                self._render_buffered(
+                    "",
+                    title,
+                    "\n`cx` is an interactive shell for managing workspace assets and running data workflows.",
+                    builtins_table,
+                    assets_table,
+                    execution_table,
+                    "",
+                ),
+            )
+        console.file.write(self._help_output[1])
+        console.file.flush()
 
     def execute_list_connections(self, args: List[str]):
+        console = get_console()
         if not self.state.connections:
             console.print("No active connections in this session.")
             return
+        from rich.table import Table
+
         table = Table(title="[bold green]Active Session Connections[/bold green]")
         table.add_column("Alias", style="cyan", no_wrap=True)
         table.add_column("Source", style="magenta")
@@ -802,46 +1325,184 @@ class CommandExecutor:
             table.add_row(str(alias), str(source))
         console.print(table)
 
-    async def execute_connect(self, args: List[str]):
-        if len(args) < 3 or args[1].lower() != "--as":
-            console.print(
-                "[bold red]Invalid syntax.[/bold red] Use: `connect <connection_source> --as <alias>`"
+    def _print_buffered(self, *renderables: Any) -> None:
+        """
+        Renders everything off-screen and writes it to the terminal at once,
+        instead of a markup/ANSI pass and flush per console.print call.
+        """
+        console = get_console()
+        console.file.write(self._render_buffered(*renderables))
+        console.file.flush()
+
+    def _render_buffered(self, *renderables: Any) -> str:
+        console = get_console()
+        if self._render_console is None:
+            self._render_console = Console(
+                file=io.StringIO(),
+                force_terminal=console.is_terminal,
+                color_system=console.color_system,
             )
-            return
-        source, alias = args[0], args[2]
-        with console.status(
-            f"Attempting to connect to '[yellow]{source}[/yellow]'...", spinner="dots"
+        buffer = self._render_console.file
+        buffer.seek(0)
+        buffer.truncate(0)
+        self._render_console.width = console.width
+        for renderable in renderables:
+            self._render_console.print(renderable)
+        return buffer.getvalue()
+
+    async def execute_connect(self, targets: List[Tuple[str, str]]):
+        """
+        Activates one or more (source, alias) connections, so
+        `connect a --as x, b --as y` tests both sources concurrently instead
+        of awaiting each round-trip in turn.
+        """
+        console = get_console()
+        # Only successes are remembered, so a failing source is always re-tested.
+        now = time.monotonic()
+        probes = self._connection_probes
+        pending = [
+            source
+            for source in dict.fromkeys(source for source, _ in targets)
+            if now - probes.get(source, -CONNECTION_PROBE_TTL) >= CONNECTION_PROBE_TTL
+        ]
+        probed = {}
+        if pending:
+            # Piped or scripted runs have no one to watch a spinner, so skip
+            # starting its Live display altogether.
+            spinner = nullcontext()
+            if console.is_terminal:
+                status_message = (
+                    f"Attempting to connect to '[yellow]{pending[0]}[/yellow]'..."
+                    if len(pending) == 1
+                    else f"Attempting to connect to {len(pending)} sources..."
+                )
+                spinner = console.status(status_message, spinner="dots")
+            with spinner:
+                results = await asyncio.gather(
+                    *(self.service.test_connection(source) for source in pending),
+                    return_exceptions=True,
+                )
+            probed = dict(zip(pending, results))
+        messages = []
+        for source, alias in targets:
+            result = probed.get(source, _CONNECTION_PROBE_HIT)
+            if isinstance(result, Exception):
+                result = {"status": "error", "message": str(result)}
+            if result.get("status") == "success":
+                if source in probed:
+                    probes[source] = now
+                self.state.connections[alias] = source
+                self._dry_run_pool.pop(source, None)
+                message = _CONNECT_SUCCESS_PREFIX.copy()
+                message.append(alias, style="cyan")
+                message.append_text(_CONNECT_SUCCESS_SUFFIX)
+            else:
+                probes.pop(source, None)
+                message = _CONNECT_FAILURE_PREFIX.copy()
+                message.append(str(result.get("message", "An unknown error occurred.")))
+            messages.append(message)
+        self._print_buffered(*messages)
+
+    def _connection_files_version(self, connection_source: str) -> tuple:
+        """Modification times of a source's connection and secrets files."""
+        resolver = self.service.resolver
+        name = connection_source.partition(":")[2]
+        version = []
+        for path in (
+            resolver.user_connections_dir / f"{name}.conn.yaml",
+            resolver.user_secrets_dir / f"{name}.secret.env",
         ):
-            result = await self.service.test_connection(source)
-        if result.get("status") == "success":
-            self.state.connections[alias] = source
-            console.print(
-                f"[bold green]✅ Connection successful.[/bold green] Alias '[cyan]{alias}[/cyan]' is now active."
-            )
-        else:
-            error_message = result.get("message", "An unknown error occurred.")
-            console.print(f"[bold red]❌ Connection failed:[/bold red] {error_message}")
+            try:
+                version.append(path.stat().st_mtime_ns)
+            except OSError:
+                version.append(None)
+        return tuple(version)
+
+    async def _resolve_for_dry_run(self, connection_source: str) -> tuple:
+        version = self._connection_files_version(connection_source)
+        pooled = self._dry_run_pool.get(connection_source)
+        if pooled is not None and pooled[0] == version:
+            self._dry_run_pool.move_to_end(connection_source)
+            return pooled[1:]
+        conn, secrets = await self.service.resolver.resolve(connection_source)
+        strategy = self.service._get_strategy_for_connection_model(conn)
+        self._dry_run_pool[connection_source] = (version, conn, secrets, strategy)
+        self._dry_run_pool.move_to_end(connection_source)
+        if len(self._dry_run_pool) > DRY_RUN_POOL_SIZE:
+            self._dry_run_pool.popitem(last=False)
+        return conn, secrets, strategy
 
     async def dry_run(self, command_text: str) -> DryRunResult:
-        try:
-            executable_obj, _ = self.transformer.transform(
-                self.parser.parse(command_text)
+        """
+        Simulates a command without executing it. Concurrent dry runs of the
+        same text (e.g. repeated keypress validations) share one task.
+        """
+        task = self._inflight_dry_runs.get(command_text)
+        if task is None:
+            task = asyncio.create_task(self._dry_run(command_text))
+            self._inflight_dry_runs[command_text] = task
+            task.add_done_callback(
+                lambda _: self._inflight_dry_runs.pop(command_text, None)
             )
-            if isinstance(executable_obj, DotNotationCommand):
-                step = executable_obj.to_step(self.state)
-                if step.run.action == "run_declarative_action":
-                    conn, secrets = await self.service.resolver.resolve(
-                        step.connection_source
-                    )
-                    strategy = self.service._get_strategy_for_connection_model(conn)
-                    if hasattr(strategy, "dry_run"):
-                        return await strategy.dry_run(
-                            conn, secrets, step.run.model_dump()
-                        )
+        # Shielded so one cancelled caller doesn't cancel the shared task.
+        return await asyncio.shield(task)
+
+    async def _dry_run(self, command_text: str) -> DryRunResult:
+        executable_obj = self._dry_run_commands.get(command_text)
+        if executable_obj is None:
+            try:
+                tree = await asyncio.get_running_loop().run_in_executor(
+                    self._parse_executor, _parse_tree, command_text
+                )
+                pipeline_command = self.transformer.transform(tree)
+                executable_obj, _ = pipeline_command.commands[0]
+            except LarkError as e:
+                # A syntax error depends only on the text, so the failure is
+                # cached like a parse and a retyped invalid command skips both
+                # the parse and the exception. The traceback is dropped so its
+                # frames are freed right away.
+                e.__traceback__ = None
+                executable_obj = DryRunResult(
+                    indicates_failure=True, message=f"Command is invalid. Error: {e}"
+                )
+            self._dry_run_commands[command_text] = executable_obj
+            if len(self._dry_run_commands) > DRY_RUN_PARSE_CACHE_SIZE:
+                self._dry_run_commands.popitem(last=False)
+        else:
+            self._dry_run_commands.move_to_end(command_text)
+        if isinstance(executable_obj, DryRunResult):
+            return executable_obj
+        handler = _DRY_RUN_HANDLERS.get((type(executable_obj), None))
+        if handler is None:
+            return _DRY_RUN_OK
+        try:
+            return await handler(self, executable_obj)
+        except (ValueError, OSError, NotImplementedError) as e:
+            # Resolution failures depend on session state, so they are not cached.
+            e.__traceback__ = None
             return DryRunResult(
-                indicates_failure=False, message="Command is syntactically valid."
+                indicates_failure=True, message=f"Command is invalid. Error: {e}"
             )
         except Exception as e:
+            # Anything else (a malformed connection file, a strategy bug) still
+            # fails just this command, so a batch of agent options is not aborted.
+            logger.warning(
+                "executor.dry_run.unexpected_error",
+                command=command_text,
+                error_type=type(e).__name__,
+                error=str(e),
+            )
             return DryRunResult(
                 indicates_failure=True, message=f"Command is invalid. Error: {e}"
             )
+
+    @_dry_run_handler(DotNotationCommand)
+    async def _dry_run_dot_notation(self, command: DotNotationCommand) -> DryRunResult:
+        conn, secrets, strategy = await self._resolve_for_dry_run(
+            command.connection_source(self.state)
+        )
+        if not hasattr(strategy, "dry_run"):
+            return _DRY_RUN_OK
+        # The params are serialized once per cached command; each strategy
+        # gets its own shallow copy.
+        return await strategy.dry_run(conn, secrets, dict(command.action_params()))
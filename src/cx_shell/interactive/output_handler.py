@@ -1,24 +1,33 @@
 # /home/dpwanjala/repositories/cx-shell/src/cx_shell/interactive/output_handler.py
 
-import json
 from abc import ABC, abstractmethod
 from typing import Any, Optional, Dict
 
+import orjson
 from rich import box
-from rich.console import Console
 from rich.panel import Panel
 from rich.pretty import Pretty
 from rich.syntax import Syntax
-from rich.table import Table
 
 # Import the command classes to identify them
 from .commands import (
     Command,
     InspectCommand,
 )
+from ..utils import get_console
+
+# Optional InspectCommand summary fields, in display order.
+_INSPECT_FIELDS = (
+    ("length", "Length"),
+    ("keys", "Keys"),
+    ("item_zero_keys", "Item[0] Keys"),
+    ("item_zero_preview", "Item[0] Preview"),
+    ("value_preview", "Value Preview"),
+)
 
-# A single, shared console instance for all rich output in the REPL
-console = Console()
+# JSON shorter than this is printed with Rich's regex highlighter instead of a
+# pygments-backed Syntax block; on a few lines the difference isn't visible.
+_SYNTAX_MIN_LENGTH = 512
 
 
 class IOutputHandler(ABC):
@@ -57,6 +66,7 @@ class RichConsoleHandler(IOutputHandler):
         """
         The definitive, corrected version of the result handler.
         """
+        console = get_console()
         # --- THIS IS THE FINAL, CORRECTED LOGIC ---
 
         if result is None:
@@ -76,18 +86,14 @@ class RichConsoleHandler(IOutputHandler):
 
         if isinstance(executable, InspectCommand):
             summary = result
-            panel_content = (
-                f"[bold]Variable:[/bold] [cyan]{summary['var_name']}[/cyan]\n"
-            )
-            panel_content += f"[bold]Type:[/bold] [green]{summary['type']}[/green]\n"
-            if "length" in summary:
-                panel_content += f"[bold]Length:[/bold] {summary['length']}\n"
-            if "keys" in summary:
-                panel_content += f"[bold]Keys:[/bold] {summary['keys']}"
-            if "item_zero_keys" in summary:
-                panel_content += (
-                    f"[bold]Item[0] Keys:[/bold] {summary['item_zero_keys']}"
-                )
+            lines = [
+                f"[bold]Variable:[/bold] [cyan]{summary['var_name']}[/cyan]",
+                f"[bold]Type:[/bold] [green]{summary['type']}[/green]",
+            ]
+            for key, label in _INSPECT_FIELDS:
+                if key in summary:
+                    lines.append(f"[bold]{label}:[/bold] {summary[key]}")
+            panel_content = "\n".join(lines)
             console.print(
                 Panel(panel_content, title="Object Inspector", border_style="yellow")
             )
@@ -96,27 +102,42 @@ class RichConsoleHandler(IOutputHandler):
         # --- Final Presentation Logic ---
         data_to_render = result  # The result is now guaranteed to be clean
         output_mode = options.get("output_mode", "default")
+        # Results are almost always uniform, so the first row decides; a
+        # non-dict row further down fails inside the table build below and
+        # falls back to JSON.
         is_list_of_dicts = (
             isinstance(data_to_render, list)
             and bool(data_to_render)
-            and all(isinstance(i, dict) for i in data_to_render)
+            and isinstance(data_to_render[0], dict)
         )
 
         # The core rendering decision.
         # If the user asks for a table, or if the result is a list of objects and no other mode is specified, render a table.
         if output_mode == "table" or (is_list_of_dicts and output_mode == "default"):
             if is_list_of_dicts:
+                # Imported here so non-tabular sessions never load rich.table.
+                from rich.table import Table
+
                 title = "Data View"
                 # ... (dynamic title logic can go here) ...
                 try:
                     table = Table(
                         title=f"[bold]{title}[/bold]", box=box.ROUNDED, show_lines=True
                     )
-                    headers = options.get("columns") or list(data_to_render[0].keys())
+                    headers = tuple(options.get("columns") or data_to_render[0].keys())
                     for header in headers:
                         table.add_column(str(header), style="cyan", overflow="fold")
-                    for row in data_to_render:
-                        table.add_row(*(str(row.get(h, "")) for h in headers))
+                    # Cells are converted a column at a time, so str() runs
+                    # inside map() rather than once per bytecode-level loop
+                    # step, then zipped back into rows. Rows may lack some
+                    # columns, hence get().
+                    columns = [
+                        list(map(str, [row.get(h, "") for row in data_to_render]))
+                        for h in headers
+                    ]
+                    add_row = table.add_row
+                    for cells in zip(*columns):
+                        add_row(*cells)
                     console.print(table)
                     return
                 except Exception:
@@ -124,11 +145,28 @@ class RichConsoleHandler(IOutputHandler):
 
         # Fallback for all other cases is to print as JSON or a Pretty representation.
         try:
+            if output_mode == "json-compact":
+                # One unhighlighted line, for copying or piping elsewhere.
+                console.out(
+                    orjson.dumps(
+                        data_to_render, default=str, option=orjson.OPT_NON_STR_KEYS
+                    ).decode(),
+                    highlight=False,
+                )
+                return
+
             if not isinstance(data_to_render, (dict, list)) or not data_to_render:
                 console.print(Pretty(data_to_render))
                 return
 
-            formatted_json = json.dumps(data_to_render, indent=2, default=str)
+            formatted_json = orjson.dumps(
+                data_to_render,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+            if len(formatted_json) < _SYNTAX_MIN_LENGTH:
+                console.print(formatted_json, markup=False)
+                return
             syntax = Syntax(formatted_json, "json", theme="monokai", line_numbers=True)
             console.print(syntax)
         except (TypeError, OverflowError):
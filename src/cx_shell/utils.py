@@ -1,7 +1,12 @@
 # /home/dpwanjala/repositories/cx-shell/src/cx_shell/utils.py
 import sys
+from functools import cache
 from pathlib import Path
 import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 # --- Centralized Path Constant ---
 # This is now the single source of truth for the CX_HOME path.
@@ -19,6 +24,17 @@ def get_pkg_root() -> Path:
         return Path(__file__).parent
 
 
+@cache
+def get_console() -> "Console":
+    """
+    Returns the shared Rich console for REPL output. It is created on first
+    use, so importing cx_shell as a library doesn't probe the terminal.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
 def get_assets_root() -> Path:
     """Gets the root directory of the bundled 'assets'."""
     return get_pkg_root() / "assets"
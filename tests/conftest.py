@@ -14,6 +14,7 @@ from cx_shell.management import (
 )
 from cx_shell import history_logger
 from cx_shell import utils
+from cx_shell.interactive import executor
 
 
 @pytest.fixture
@@ -41,5 +42,11 @@ def clean_cx_home(tmp_path: Path, monkeypatch):
     monkeypatch.setattr(process_manager, "CX_HOME", temp_cx_home)
     monkeypatch.setattr(history_logger, "CX_HOME", temp_cx_home)
     monkeypatch.setattr(history_logger, "CONTEXT_DIR", temp_cx_home / "context")
+    monkeypatch.setattr(
+        executor, "PARSER_CACHE_FILE", temp_cx_home / "cache" / "cx_grammar.lark.cache"
+    )
+    # A background prewarm could outlive the patch above and write the grammar
+    # cache into the real ~/.cx; tests build the parser on first use instead.
+    monkeypatch.setenv("CX_NO_PREWARM", "1")
 
     yield temp_cx_home
@@ -109,3 +109,53 @@ async def test_agent_simple_workflow_e2e(
 
     # Verify the agent session was cleaned up correctly from the state.
     assert "_agent_beliefs" not in executor.state.variables
+
+
+@pytest.mark.asyncio
+async def test_agent_prunes_redundant_connect_options(executor: CommandExecutor):
+    """Unit Test: Verifies a suggested 'connect' for an already active alias is pruned before the dry run."""
+    executor.state.connections["gh"] = "user:github"
+    options = [
+        CommandOption(
+            cx_command=command, reasoning="Candidate command.", confidence=0.9
+        )
+        for command in (
+            "connect user:github --as gh",
+            "connect user:db --as db",
+            "connection list",
+        )
+    ]
+
+    valid_options = await executor.orchestrator._statically_validate_options(options)
+
+    assert [option.cx_command for option in valid_options] == [
+        "connect user:db --as db",
+        "connection list",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_agent_activates_existing_compatible_connection(
+    executor: CommandExecutor, mocker: MockerFixture, tmp_path
+):
+    """Unit Test: Verifies the agent connects a saved, compatible connection the user picks instead of creating one."""
+    orchestrator = executor.orchestrator
+    mocker.patch.object(orchestrator.tool_specialist, "load_config_if_needed")
+    profile = mocker.MagicMock()
+    profile.planner.connection_alias = "cx_openai"
+    orchestrator.tool_specialist.agent_config = mocker.MagicMock(
+        default_profile="default", profiles={"default": profile}
+    )
+    (tmp_path / "openai.conn.yaml").write_text(
+        "id: user:my-openai\napi_catalog_id: community/openai@1.0.0\n"
+    )
+    mocker.patch.object(executor.connection_manager, "connections_dir", tmp_path)
+    mocker.patch.object(
+        orchestrator.prompt_session, "prompt_async", return_value="my-openai"
+    )
+    executor.service = AsyncMock()
+    executor.service.test_connection.return_value = {"status": "success"}
+
+    assert await orchestrator._ensure_agent_connection("planner")
+    assert executor.state.connections["cx_openai"] == "user:my-openai"
+    executor.service.test_connection.assert_awaited_once_with("user:my-openai")
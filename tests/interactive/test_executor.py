@@ -1,5 +1,9 @@
+import os
+import shutil
+
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
+from cx_shell.interactive import executor as executor_module
 from cx_shell.interactive.executor import CommandExecutor
 from cx_shell.interactive.session import SessionState
 
@@ -33,6 +37,58 @@ async def test_executor_connect_command_updates_state(executor: CommandExecutor)
     assert executor.state.connections["gh"] == "user:github"
 
 
+@pytest.mark.asyncio
+async def test_executor_batch_connect_activates_successful_aliases(
+    executor: CommandExecutor,
+):
+    """Unit Test: Verifies a batched 'connect' tests every source and keeps only the successes."""
+    executor.service.test_connection.side_effect = lambda source: (
+        {"status": "success"}
+        if source != "user:broken"
+        else {"status": "error", "message": "Login failed"}
+    )
+
+    await executor.execute(
+        "connect user:github --as gh, user:broken --as bad, user:db --as db"
+    )
+
+    assert executor.service.test_connection.await_count == 3
+    assert executor.state.connections == {"gh": "user:github", "db": "user:db"}
+
+
+@pytest.mark.asyncio
+async def test_executor_connect_reuses_recent_successful_probe(
+    executor: CommandExecutor,
+):
+    """Unit Test: Verifies a source that just connected successfully is not re-tested, while failures always are."""
+    executor.service.test_connection.return_value = {"status": "success"}
+    await executor.execute("connect user:github --as gh")
+    await executor.execute("connect user:github --as gh2")
+
+    assert executor.service.test_connection.await_count == 1
+    assert executor.state.connections == {"gh": "user:github", "gh2": "user:github"}
+
+    executor.service.test_connection.return_value = {
+        "status": "error",
+        "message": "Login failed",
+    }
+    await executor.execute("connect user:db --as db")
+    await executor.execute("connect user:db --as db")
+
+    assert executor.service.test_connection.await_count == 3
+    assert "db" not in executor.state.connections
+
+
+@pytest.mark.asyncio
+async def test_executor_skips_blank_and_comment_lines(executor: CommandExecutor):
+    """Unit Test: Verifies blank and '#' comment lines are ignored without producing output."""
+    for line in ("", "   ", "# connect user:github --as gh", "  # indented note"):
+        assert await executor.execute(line) is None
+
+    executor.output_handler.handle_result.assert_not_awaited()
+    assert executor.state.connections == {}
+
+
 @pytest.mark.asyncio
 async def test_executor_variable_assignment(executor: CommandExecutor):
     """Unit Test: Verifies a command result can be assigned to a variable."""
@@ -73,3 +129,83 @@ async def test_executor_session_persistence(executor: CommandExecutor):
     assert isinstance(loaded_state, SessionState)
     assert loaded_state.connections.get("test_alias") == "user:test_conn"
     assert loaded_state.variables.get("test_var") == "hello world"
+
+
+@pytest.mark.asyncio
+async def test_executor_unhandled_subcommand_reports_success(executor: CommandExecutor):
+    """Unit Test: Verifies a management command without a dedicated handler falls back to the generic success result."""
+    await executor.execute("process stop 1234")
+
+    result = executor.output_handler.handle_result.await_args.args[0]
+    assert result == {"status": "success", "message": "Command executed."}
+
+
+@pytest.mark.asyncio
+async def test_executor_compile_maps_flags_to_arguments(executor: CommandExecutor):
+    """Unit Test: Verifies 'compile' flags are mapped onto CompileManager.run_compile's arguments."""
+    executor.compile_manager.run_compile = AsyncMock()
+
+    await executor.execute(
+        'compile --spec-url "https://x/openapi.json" --name "x" --version "1.0"'
+    )
+
+    executor.compile_manager.run_compile.assert_awaited_once_with(
+        spec_source="https://x/openapi.json", name="x", version="1.0"
+    )
+
+
+@pytest.mark.asyncio
+async def test_executor_dry_run_reports_unexpected_errors_as_failures(
+    executor: CommandExecutor,
+):
+    """Unit Test: Verifies an unexpected error while resolving a dry run fails that command instead of raising."""
+    executor.state.connections["gh"] = "user:github"
+    executor.service.resolver.resolve.side_effect = KeyError("id")
+
+    result = await executor.dry_run('gh.getUser(username="test")')
+
+    assert result.indicates_failure
+    assert "id" in result.message
+
+
+def test_build_lark_ignores_corrupt_bundled_tables(tmp_path, monkeypatch):
+    """Unit Test: Verifies corrupt bundled parser tables with a matching digest fall back to building the grammar."""
+    grammar_path = executor_module._grammar_dir() / "cx.lark"
+    shutil.copy(grammar_path, tmp_path / "cx.lark")
+    digest = executor_module._grammar_digest(grammar_path.read_text(encoding="utf-8"))
+    (tmp_path / executor_module.BUNDLED_PARSER_TABLES).write_bytes(
+        digest + b"\nnot a pickle"
+    )
+    monkeypatch.setattr(executor_module, "_grammar_dir", lambda: tmp_path)
+
+    parser = executor_module._build_lark(False)
+
+    assert parser.parse("connections").data == "pipeline"
+
+
+@pytest.mark.asyncio
+async def test_executor_dry_run_re_resolves_edited_connections(
+    executor: CommandExecutor, tmp_path
+):
+    """Unit Test: Verifies a pooled dry-run connection is reused until its secrets file changes."""
+    resolver = executor.service.resolver
+    resolver.user_connections_dir = tmp_path
+    resolver.user_secrets_dir = tmp_path
+    resolver.resolve.return_value = (object(), {})
+    executor.service._get_strategy_for_connection_model = MagicMock(
+        return_value=object()
+    )
+    (tmp_path / "github.conn.yaml").write_text("id: user:github\n")
+    secrets_file = tmp_path / "github.secret.env"
+    secrets_file.write_text("TOKEN=old\n")
+    os.utime(secrets_file, ns=(1_000_000_000, 1_000_000_000))
+    executor.state.connections["gh"] = "user:github"
+
+    await executor.dry_run('gh.getUser(username="a")')
+    await executor.dry_run('gh.getUser(username="b")')
+    assert resolver.resolve.await_count == 1
+
+    secrets_file.write_text("TOKEN=new\n")
+    os.utime(secrets_file, ns=(2_000_000_000, 2_000_000_000))
+    await executor.dry_run('gh.getUser(username="c")')
+    assert resolver.resolve.await_count == 2